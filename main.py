@@ -2,12 +2,33 @@
 from orcon_ramses_rf_command import OrconRamsesRFCommand
 from mqtt_client import MQTTClient
 import paho.mqtt.client as mqtt
-import time
 import logging
 import sys
 
 logger = logging.getLogger(__name__)
 
+def send_commands(mqtt_client, commands):
+    """
+    Publish a batch of commands over an already connected MQTT client.
+
+    The client is expected to stay connected between batches, so sending
+    commands never pays for a new CONNECT/CONNACK round trip.
+    """
+    # Materialise once: the commands are iterated for logging and publishing.
+    commands = tuple(commands)
+
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Commands:")
+        for cmd in commands:
+            logger.debug(cmd)
+
+    # Queue the whole batch first, then wait once for all of it to be sent.
+    infos = [mqtt_client.publish_command(cmd) for cmd in commands]
+
+    if not mqtt_client.wait_for_publish(infos, timeout=2):
+        logger.warning("Not all commands were sent")
+
+
 def main():
     """
     Main entry point for demonstration. 
@@ -17,10 +38,14 @@ def main():
     # Create an instance with default addresses
     orcon = OrconRamsesRFCommand(remote_address="37:XX", wtw_address="32:YY", capacity_in_m3_per_hour=400)
 
+    # One long-lived client; a fixed client ID lets the broker keep the
+    # session across reconnects.
     mqtt_client = MQTTClient(
         server="192.168.2.35",
         port=1883,  # Replace with your MQTT server port
         topic="RAMSES/GATEWAY/18:129404/tx",
+        client_id="orcon_ramses_rf_command",
+        clean_session=False,
         tls=False  # Set to True if using TLS
     )
 
@@ -28,20 +53,17 @@ def main():
         # Connect to MQTT broker
         mqtt_client.connect()
         
-        # Give some time to establish the connection
-        time.sleep(1)
+        # Wait for the broker to acknowledge the connection
+        if not mqtt_client.wait_connected(5):
+            logger.error("Timed out waiting for the MQTT connection")
+            return
 
         # Example 2: Set fan speed to 104 m3/h
         commands = orcon.set_fan_speed("low", 104)
         # Example 3: Set fan speed to low mode
         commands += orcon.set_to_low_mode()
 
-        logger.debug(f"Commands:")
-        
-        for cmd in commands:
-            logger.debug(cmd)
-            mqtt_client.publish_command(cmd)
-            time.sleep(1)
+        send_commands(mqtt_client, commands)
     
     finally:
         # Disconnect from MQTT broker
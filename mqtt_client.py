@@ -1,15 +1,89 @@
+import functools
 import json
 import logging
-from typing import Optional
-
-import json
-import logging
-from typing import Optional
+import re
+import threading
+import time
+from typing import Callable, Iterable, List, Optional, Union
 
 import paho.mqtt.client as mqtt
 
 logger = logging.getLogger(__name__)
 
+# Wrapped around a command, gives the same output as json.dumps({"msg": command})
+# for commands that need no escaping.
+_PAYLOAD_PREFIX = b'{"msg": "'
+_PAYLOAD_SUFFIX = b'"}'
+
+# Matches any byte that JSON would escape in a string, i.e. anything outside
+# printable ASCII, plus the quote and backslash characters.
+_NEEDS_ESCAPE = re.compile(rb'[^\x20-\x21\x23-\x5b\x5d-\x7e]')
+
+_ERR_SUCCESS = mqtt.MQTT_ERR_SUCCESS
+
+
+class CommandSchedule(threading.Thread):
+    """
+    A worker thread that publishes commands in order, spaced by a fixed interval.
+
+    Returned by `MQTTClient.schedule_commands()`. If a publish raises or fails
+    to queue, the remaining commands are skipped and the error is kept in
+    `error`. The message infos of the queued commands are kept in `infos`.
+    """
+
+    def __init__(self, publish: Callable[[Union[str, bytes]], mqtt.MQTTMessageInfo],
+                 commands: Iterable[Union[str, bytes]], interval: float):
+        """
+        :param publish: Function that publishes a single command.
+        :param commands: The commands to publish, in order.
+        :param interval: Delay between consecutive commands in seconds.
+        """
+        super().__init__(name="mqtt-command-schedule")
+        self._publish = publish
+        self._commands = tuple(commands)
+        self._interval = interval
+        self._cancelled = threading.Event()
+        self.infos: List[mqtt.MQTTMessageInfo] = []
+        self.error: Optional[Exception] = None
+
+    def run(self):
+        for i, command in enumerate(self._commands):
+            # Wait before every command but the first; cancel() wakes the
+            # wait and stops the schedule.
+            if self._cancelled.wait(self._interval if i else 0):
+                return
+            try:
+                info = self._publish(command)
+            except Exception as e:
+                self.error = e
+                return
+            if info.rc != _ERR_SUCCESS:
+                self.error = RuntimeError(
+                    f"Failed to publish command {command!r}: {mqtt.error_string(info.rc)}"
+                )
+                return
+            self.infos.append(info)
+
+    def cancel(self):
+        """
+        Stop publishing; commands not yet published are skipped.
+        """
+        self._cancelled.set()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait for the schedule to finish and raise the publish error, if any.
+
+        :param timeout: Maximum time to wait in seconds. None waits forever.
+        :return: True if every command was queued, False if the timeout expired
+            or the schedule was cancelled first.
+        """
+        self.join(timeout)
+        if self.error is not None:
+            raise self.error
+        return not self.is_alive() and len(self.infos) == len(self._commands)
+
+
 class MQTTClient:
     """
     A class to handle MQTT connections and publish JSON-wrapped messages.
@@ -24,6 +98,7 @@ class MQTTClient:
         username: Optional[str] = None,
         password: Optional[str] = None,
         keepalive: int = 60,
+        clean_session: bool = True,
         tls: bool = False,
         tls_ca_cert: Optional[str] = None,
         tls_certfile: Optional[str] = None,
@@ -39,6 +114,8 @@ class MQTTClient:
         :param username: Username for MQTT broker authentication.
         :param password: Password for MQTT broker authentication.
         :param keepalive: Keepalive interval in seconds. Default is 60.
+        :param clean_session: Whether the broker discards the session on disconnect.
+            Set to False to keep a persistent session; requires a fixed client_id.
         :param tls: Whether to use TLS. Default is False.
         :param tls_ca_cert: Path to CA certificate file.
         :param tls_certfile: Path to client certificate file.
@@ -46,17 +123,21 @@ class MQTTClient:
         """
         self.server = server
         self.port = port
-        self.topic = topic
+        self._topic = topic
         self.client_id = client_id or f"mqtt_client_{id(self)}"
         self.username = username
         self.password = password
         self.keepalive = keepalive
+        self.clean_session = clean_session
         self.tls = tls
         self.tls_ca_cert = tls_ca_cert
         self.tls_certfile = tls_certfile
         self.tls_keyfile = tls_keyfile
 
-        self.client = mqtt.Client(client_id=self.client_id)
+        if not self.clean_session and not client_id:
+            raise ValueError("A fixed client_id must be provided for a persistent session.")
+
+        self.client = mqtt.Client(client_id=self.client_id, clean_session=self.clean_session)
         if self.username and self.password:
             self.client.username_pw_set(self.username, self.password)
 
@@ -69,6 +150,14 @@ class MQTTClient:
                 keyfile=self.tls_keyfile,
             )
 
+        self._bind_publish()
+
+        # Set once the broker has acknowledged the connection.
+        self._connected = threading.Event()
+
+        # Schedules started by schedule_commands(), cancelled on disconnect.
+        self._schedules: List[CommandSchedule] = []
+
         # Assign callbacks
         self.client.on_connect = self.on_connect
         self.client.on_disconnect = self.on_disconnect
@@ -76,7 +165,26 @@ class MQTTClient:
 
         # Setup logging
         self.logger = logger
-        self.logger.debug(f"Initialization parameters: {self.__dict__}")
+        self.logger.debug("Initialization parameters: %s", self.__dict__)
+
+    @property
+    def topic(self) -> str:
+        """The MQTT topic messages are published to."""
+        return self._topic
+
+    @topic.setter
+    def topic(self, topic: str) -> None:
+        self._topic = topic
+        self._bind_publish()
+
+    def _bind_publish(self):
+        """
+        Bind the topic and publish options once for the publish hot path.
+
+        Orcon commands are idempotent, so QoS 0 is enough: a lost command
+        can simply be sent again.
+        """
+        self._publish = functools.partial(self.client.publish, self._topic, qos=0, retain=False)
 
     def on_connect(self, client, userdata, flags, rc):
         """
@@ -88,9 +196,10 @@ class MQTTClient:
         :param rc: Connection result.
         """
         if rc == 0:
-            self.logger.info(f"Connected to MQTT Broker: {self.server}:{self.port}")
+            self.logger.info("Connected to MQTT Broker: %s:%s", self.server, self.port)
+            self._connected.set()
         else:
-            self.logger.error(f"Failed to connect, return code {rc}")
+            self.logger.error("Failed to connect, return code %s", rc)
 
     def on_disconnect(self, client, userdata, rc):
         """
@@ -100,9 +209,10 @@ class MQTTClient:
         :param userdata: Private user data.
         :param rc: Disconnection result.
         """
+        self._connected.clear()
         self.logger.info("Disconnected from MQTT Broker")
         if rc != 0:
-            self.logger.warning(f"Unexpected disconnection. Return code: {rc}")
+            self.logger.warning("Unexpected disconnection. Return code: %s", rc)
 
     def on_publish(self, client, userdata, mid):
         """
@@ -112,41 +222,125 @@ class MQTTClient:
         :param userdata: Private user data.
         :param mid: Message ID.
         """
-        self.logger.debug(f"Message {mid} published.")
+        self.logger.debug("Message %s published.", mid)
 
     def connect(self):
         """
         Connect to the MQTT broker and start the network loop.
         """
-        self.logger.debug(f"Connecting to MQTT Broker: {self.server}:{self.port}")
+        self.logger.debug("Connecting to MQTT Broker: %s:%s", self.server, self.port)
         try:
             self.client.connect(self.server, self.port, self.keepalive)
             self.client.loop_start()
         except Exception as e:
-            self.logger.error(f"Failed to connect to MQTT Broker: {e}")
+            self.logger.error("Failed to connect to MQTT Broker: %s", e)
             raise
 
+    def wait_connected(self, timeout: Optional[float] = 5) -> bool:
+        """
+        Block until the broker has acknowledged the connection.
+
+        :param timeout: Maximum time to wait in seconds. None waits forever.
+        :return: True if connected, False if the timeout expired.
+        """
+        return self._connected.wait(timeout)
+
     def disconnect(self):
         """
         Disconnect from the MQTT broker and stop the network loop.
+
+        Scheduled commands that have not been published yet are cancelled.
         """
+        schedules, self._schedules = self._schedules, []
+        for schedule in schedules:
+            schedule.cancel()
+        for schedule in schedules:
+            schedule.join()
         self.client.loop_stop()
         self.client.disconnect()
 
-    def publish_command(self, command: str):
+    def publish_command(self, command: Union[str, bytes]) -> mqtt.MQTTMessageInfo:
         """
         Wrap the command in a JSON message and publish to the MQTT topic.
 
-        :param command: The command string to publish.
+        The publish is queued without waiting for it to be sent, so several
+        commands can be fired back to back. Use the returned message info
+        to wait for delivery once the whole batch has been queued.
+
+        :param command: The command to publish, as a string or ASCII bytes.
+        :return: The message info of the queued publish.
         """
-        message = {"msg": command}
-        payload = json.dumps(message)
-        try:
-            result = self.client.publish(self.topic, payload)
-            if result.rc != mqtt.MQTT_ERR_SUCCESS:
-                self.logger.error(f"Failed to publish message: {result}")
+        # RAMSES commands are plain ASCII, so the JSON wrapper can be filled
+        # in directly; only fall back to json.dumps if escaping is needed.
+        # The payload is handed to paho as bytes so it skips its own UTF-8
+        # encoding step; json.dumps escapes anything outside ASCII.
+        if isinstance(command, bytes):
+            # Bytes are checked in one pass and wrapped as they are.
+            if _NEEDS_ESCAPE.search(command) is None:
+                payload = _PAYLOAD_PREFIX + command + _PAYLOAD_SUFFIX
             else:
-                self.logger.info(f"Published message to {self.topic}: {payload}")
+                payload = json.dumps({"msg": command.decode("ascii")}).encode("ascii")
+        elif (command.isascii() and command.isprintable()
+                and '"' not in command and "\\" not in command):
+            payload = _PAYLOAD_PREFIX + command.encode("ascii") + _PAYLOAD_SUFFIX
+        else:
+            payload = json.dumps({"msg": command}).encode("ascii")
+        try:
+            # No explicit flush is needed: paho wakes the network thread
+            # started by loop_start() as soon as a packet is queued, and
+            # writes in-line when no loop thread is running. Calling
+            # loop_write() here would race with that thread.
+            result = self._publish(payload)
+            if result.rc != _ERR_SUCCESS:
+                self.logger.error("Failed to publish message: %s", result)
+            elif self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("Published message to %s: %s", self._topic, payload.decode("ascii"))
+            return result
         except Exception as e:
-            self.logger.error(f"Exception during publish: {e}")
+            self.logger.error("Exception during publish: %s", e)
             raise
+
+    def wait_for_publish(self, infos: Iterable[mqtt.MQTTMessageInfo], timeout: float = 2) -> bool:
+        """
+        Wait until a batch of queued publishes has been sent.
+
+        All messages share a single deadline, so a batch never waits longer
+        than `timeout` in total. Publishes that already failed to queue are
+        not waited on.
+
+        :param infos: The message infos returned by `publish_command()`.
+        :param timeout: Maximum time to wait for the whole batch in seconds.
+        :return: True if every message was sent before the deadline.
+        """
+        deadline = time.monotonic() + timeout
+        all_sent = True
+        for info in infos:
+            if info.rc != _ERR_SUCCESS:
+                all_sent = False
+                continue
+            info.wait_for_publish(max(0.0, deadline - time.monotonic()))
+            all_sent = all_sent and info.is_published()
+        return all_sent
+
+    def schedule_commands(
+        self, commands: Iterable[Union[str, bytes]], interval: float
+    ) -> CommandSchedule:
+        """
+        Publish commands spaced `interval` seconds apart without blocking the caller.
+
+        The commands are published in order from a single worker thread, the
+        first one right away. Use this instead of sleeping between publishes
+        when the unit needs time between commands. `disconnect()` cancels any
+        commands that are still pending.
+
+        :param commands: The commands to publish, in order.
+        :param interval: Delay between consecutive commands in seconds.
+        :return: The started schedule; call its `wait()` to wait for it and
+            raise a publish error, or `cancel()` to stop it.
+        """
+        schedule = CommandSchedule(self.publish_command, commands, interval)
+        # Drop finished schedules so the list does not grow without bound.
+        self._schedules = [s for s in self._schedules if s.is_alive()]
+        self._schedules.append(schedule)
+        schedule.start()
+        return schedule
@@ -1,7 +1,116 @@
+import functools
 import logging
+from typing import Iterable, Tuple, Union
 
 logger = logging.getLogger(__name__)
 
+# The RAMSES gateway takes frames as text with the payload in hex, so payloads
+# are assembled as hex strings directly instead of as bytes.
+# Two-digit uppercase hex for every byte value, and four-digit uppercase hex
+# for the 16-bit values used (comfort temperature up to 3000, bypass speed
+# up to 1000).
+_HEX2 = tuple(f"{i:02X}" for i in range(256))
+_HEX4 = tuple(f"{i:04X}" for i in range(0x1000))
+
+# 2411 payload template for each fan speed parameter (3 through 8), with the
+# ParamID (parameter + 0x3C) and the fixed suffix baked in.
+_FAN_SPEED_TEMPLATES = {
+    3: "00003F000F000000%s00000000000000A0000000010032",
+    4: "000040000F000000%s00000000000000A0000000010032",
+    5: "000041000F000000%s00000000000000C8000000010032",
+    6: "000042000F000000%s00000014000000C8000000010032",
+    7: "000043000F000000%s00000000000000C8000000010032",  # Corrected suffix for parameter 7
+    8: "000044000F000000%s00000014000000C8000000010032",  # Corrected suffix for parameter 8
+}
+
+# Encoding of each parameter with a single value, keyed by parameter number:
+# (2411 payload template with the ParamID and fixed bytes baked in,
+#  minimum value, maximum value, value-to-hex function, range error message).
+_PARAM_ENCODINGS = {
+    1: ("00003D000F000000%s0000000000000050000000010032", 0, 40,
+        lambda speed: _HEX2[speed * 2],
+        "Speed percentage for absence supply fan must be between 0 and 40."),
+    2: ("00003E000F000000%s0000000000000050000000010032", 0, 40,
+        lambda speed: _HEX2[speed * 2],
+        "Speed percentage for absence exhaust fan must be between 0 and 40."),
+    9: ("000095000F000000%s00000000000000C8000000010032", 0, 100,
+        lambda speed: _HEX2[speed * 2],
+        "Speed percentage for boost mode must be between 0 and 100."),
+    # Multiply the sensitivity value by 12 to match observed encoding (e.g., 5 -> 0x3C).
+    12: ("0000520001000000%s00000000000000FA000000010032", 0, 15,
+         lambda sensitivity: _HEX2[sensitivity * 12],
+         "Sensor sensitivity must be between 0 and 15."),
+    13: ("0000540000000000%s0000000F0000003C00000001002A", 15, 60,
+         lambda minutes: _HEX2[minutes],
+         "Humidity scenario runtime must be between 15 and 60 minutes."),
+    # Hundredths of a degree, in 4 hex digits. Rounded, since truncating
+    # would turn e.g. 0.29 * 100 = 28.999... into 28 instead of 29.
+    14: ("00007500920000%s0000000000000BB8000000010001", 0.0, 30.0,
+         lambda temperature: _HEX4[round(temperature * 100)],
+         "Comfort temperature must be between 0.0 and 30.0°C."),
+    15: ("0000A1000F000000%s000000000000003C000000010001", 0, 30,
+         lambda temperature: _HEX2[temperature * 2],
+         "Activation temperature must be between 0 and 30 degrees Celsius."),
+    # Ten times the percentage, in 4 hex digits.
+    16: ("00007900110000%s00000000000003E8000000010032", 0, 100,
+         lambda speed: _HEX4[speed * 10],
+         "Speed percentage for minimum fan speed during bypass must be between 0 and 100."),
+}
+
+# Filter replacement payload for each allowed number of days (parameter 10).
+_FILTER_PAYLOADS = {
+    90:  "00003100100000005A00000000000007080000001E002C",
+    120: "00003100100000007800000000000007080000001E002C",
+    150: "00003100100000009600000000000007080000001E002C",
+    180: "0000310010000000B400000000000007080000001E002C",
+}
+
+# Bypass fan speed regulation payload for each allowed setting (parameter 17).
+_BYPASS_REGULATION_PAYLOADS = {
+    3: "0000E70000000000030000000300000005000000010000",
+    4: "0000E70000000000040000000300000005000000010000",
+}
+
+# Bypass fan speed setting payload for each allowed setting (parameter 18).
+_BYPASS_SETTING_PAYLOADS = {
+    0: "0000E80000000000000000000000000001000000010000",
+    1: "0000E80000000000010000000000000001000000010000",
+}
+
+# Supply and exhaust parameter for each fan speed level.
+_LEVEL_PARAMS = {
+    "low": (3, 4),
+    "medium": (5, 6),
+    "high": (7, 8),
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _build_payload(param: int, speed_percentage: int) -> str:
+    """
+    Build the 2411 hex payload that sets the fan speed for a given parameter (3 through 8).
+
+    The result only depends on the arguments, so it is cached: repeated
+    low/medium/high settings skip the formatting and validation entirely.
+    Invalid arguments raise and are never cached, so the cache is bounded
+    by the 6 x 100 valid combinations and a full sweep fits without evictions.
+
+    :param param: The parameter number (3..8).
+    :param speed_percentage: The speed percentage (1..100).
+    :return: The hex string payload (without spacing).
+    :raises ValueError: if param or speed_percentage are out of range.
+    """
+    # The template table doubles as the check on the parameter number.
+    try:
+        template = _FAN_SPEED_TEMPLATES[param]
+    except KeyError:
+        raise ValueError("Parameter must be between 3 and 8.") from None
+    if not 1 <= speed_percentage <= 100:
+        raise ValueError("Speed percentage must be between 1 and 100.")
+
+    # The speed is encoded at twice the percentage.
+    return template % _HEX2[speed_percentage * 2]
+
 
 class OrconRamsesRFCommand:
     """
@@ -31,25 +140,155 @@ class OrconRamsesRFCommand:
 
     Additional Functions:
         - Bypass Control: Includes `open_bypass()`, `close_bypass()`, and `automatic_bypass()` for managing the bypass settings.
+        - Batch Fan Speeds: `set_fan_speeds()` generates the fan speed commands for several levels in one call.
         - Predefined Modes: Functions like `set_to_low_mode()`, `set_to_medium_mode()`, `set_to_high_mode()`, and `set_to_auto_mode()` provide convenience for common operations.
+        - Fixed Commands: `static_command(name)` returns any of the fixed-payload mode and bypass commands by name.
 
     Note: The parameter mappings and ranges are based on the official configuration table provided in the documentation.
     """
 
-    def __init__(self, remote_address, wtw_address, capacity_in_m3_per_hour=400):
+    __slots__ = (
+        "_remote",
+        "_wtw",
+        "_capacity_in_m3_per_hour",
+        "_pct_table",
+        "_w_prefix",
+        "_humidity_msgs",
+        "_filter_msgs",
+        "_bypass_regulation_msgs",
+        "_bypass_setting_msgs",
+        "_param_templates",
+        "_min_bypass_msgs",
+        "_static_cmds",
+    )
+
+    def __init__(self, remote_address: str, wtw_address: str, capacity_in_m3_per_hour: int = 400) -> None:
         """
         :param remote_address: The address of the remote (e.g. "37:11111")
         :param wtw_address: The address of the WTW unit (e.g. "32:222222")
+        :param capacity_in_m3_per_hour: The maximum flow rate of the unit in m³/h.
+        :raises ValueError: if the capacity is not greater than 0.
         """
-        self.remote = remote_address
-        self.wtw = wtw_address
+        self._remote = remote_address
+        self._wtw = wtw_address
+        # Also builds the percentage table for the capacity.
         self.capacity_in_m3_per_hour = capacity_in_m3_per_hour
-        self.logger = logger
+
+        # Build every message that only depends on the addresses.
+        self._build_messages()
+
+    def _build_messages(self) -> None:
+        """
+        Build the message prefixes and tables from the remote and WTW addresses.
+
+        Called on construction and again whenever an address changes, so the
+        prebuilt messages always match the current addresses.
+        """
+        # Header shared by all 2411 parameter writes.
+        self._w_prefix = f"W --- {self.remote} {self.wtw} --:------ 2411 023 "
+
+        # Humidity scenario messages, keyed by mode (0: Midden, 1: Hoog).
+        self._humidity_msgs = {
+            0: (self._w_prefix + "00004E0000000000000000000000000001000000010000",),
+            1: (self._w_prefix + "00004E0000000000010000000000000001000000010000",),
+        }
+
+        # Filter replacement messages, keyed by the number of days.
+        self._filter_msgs = {
+            days: (self._w_prefix + payload,)
+            for days, payload in _FILTER_PAYLOADS.items()
+        }
+
+        # Bypass fan speed regulation and setting messages, keyed by setting.
+        self._bypass_regulation_msgs = {
+            setting: (self._w_prefix + payload,)
+            for setting, payload in _BYPASS_REGULATION_PAYLOADS.items()
+        }
+        self._bypass_setting_msgs = {
+            setting: (self._w_prefix + payload,)
+            for setting, payload in _BYPASS_SETTING_PAYLOADS.items()
+        }
+
+        # Complete message template for each parameter with a single value,
+        # keyed by parameter number. The range and encoder stay in the module
+        # table, so instances only hold strings and remain picklable.
+        self._param_templates = {
+            param: self._w_prefix + template
+            for param, (template, *_) in _PARAM_ENCODINGS.items()
+        }
+
+        # Minimum fan speed during bypass messages for every valid percentage
+        # (parameter 16), indexed by the percentage, with the range and error
+        # message from the parameter encoding.
+        _, low, high, encode, error = _PARAM_ENCODINGS[16]
+        template = self._param_templates[16]
+        self._min_bypass_msgs = (
+            tuple((template % encode(speed),) for speed in range(low, high + 1)),
+            low,
+            high,
+            error,
+        )
+
+        # Commands with a fixed payload only depend on the addresses, so
+        # build them once instead of on every call. They are stored as the
+        # ready-made (immutable) return value.
+        i_22f1 = f"I --- {self.remote} {self.wtw} --:------ 22F1 003 "
+        w_22f7 = f"W --- {self.remote} {self.wtw} --:------ 22F7 003 "
+        self._static_cmds = {
+            "off": (i_22f1 + "000007",),
+            "low": (i_22f1 + "000104",),
+            "medium": (i_22f1 + "000204",),
+            "high": (i_22f1 + "000304",),
+            "auto": (i_22f1 + "000407",),
+            "auto2": (i_22f1 + "000507",),
+            "boost": (i_22f1 + "000607",),
+            "disable": (i_22f1 + "000707",),
+            "open_bypass": (w_22f7 + "00C8EF",),
+            "close_bypass": (w_22f7 + "0000EF",),
+            "automatic_bypass": (w_22f7 + "00FFEF",),
+        }
+
+    @property
+    def remote(self) -> str:
+        """The address of the remote."""
+        return self._remote
+
+    @remote.setter
+    def remote(self, remote_address: str) -> None:
+        self._remote = remote_address
+        self._build_messages()
+
+    @property
+    def wtw(self) -> str:
+        """The address of the WTW unit."""
+        return self._wtw
+
+    @wtw.setter
+    def wtw(self, wtw_address: str) -> None:
+        self._wtw = wtw_address
+        self._build_messages()
+
+    @property
+    def capacity_in_m3_per_hour(self) -> int:
+        """The maximum flow rate of the unit in m³/h."""
+        return self._capacity_in_m3_per_hour
+
+    @capacity_in_m3_per_hour.setter
+    def capacity_in_m3_per_hour(self, capacity_in_m3_per_hour: int) -> None:
+        if not capacity_in_m3_per_hour > 0:
+            raise ValueError("Capacity in m3/h must be greater than 0.")
+        self._capacity_in_m3_per_hour = capacity_in_m3_per_hour
+
+        # Fan speed percentage for every whole flow rate up to the capacity.
+        self._pct_table = tuple(
+            int(m3_per_hour * 100 // capacity_in_m3_per_hour)
+            for m3_per_hour in range(int(capacity_in_m3_per_hour) + 1)
+        )
 
     def _fan_speed_payload(self, param: int, speed_percentage: int) -> str:
         """
-        Build the hex payload for the 'W --- 37:... 32:... --:------ 2411 023 ...' message.
-        This payload sets the speed for a given parameter (3 through 8).
+        Build the 'W --- 37:... 32:... --:------ 2411 023 ...' message.
+        This message sets the speed for a given parameter (3 through 8).
 
         The speed is encoded at twice the percentage 
         (e.g. 28% → 56 decimal → 0x38 in hex).
@@ -70,241 +309,211 @@ class OrconRamsesRFCommand:
         
         :param param: The parameter number (3..8).
         :param speed_percentage: The speed percentage (1..100).
-        :return: The hex string payload (without spacing).
+        :return: The command string for the parameter.
         :raises ValueError: if param or speed_percentage are out of range.
         """
-        param_suffix = {
-            3: "00000000000000A0000000010032",
-            4: "00000000000000A0000000010032",
-            5: "00000000000000C8000000010032",
-            6: "00000014000000C8000000010032",
-            7: "00000000000000C8000000010032",  # Corrected suffix for parameter 7
-            8: "00000014000000C8000000010032"   # Corrected suffix for parameter 8
-        }
-
-        if not (3 <= param <= 8):
-            raise ValueError("Parameter must be between 3 and 8.")
-        if not (1 <= speed_percentage <= 100):
-            raise ValueError("Speed percentage must be between 1 and 100.")
-
-        # Calculate the ParamID (offset by 0x3C from the parameter).
-        param_id = param + 0x3C
-
-        # Multiply the speed percentage by 2 to get the hex value.
-        speed_hex = f"{speed_percentage * 2:02X}"
+        return self._w_prefix + _build_payload(param, speed_percentage)
+    
+    def _encode_param(self, param: int, value: Union[int, float]) -> Tuple[str, ...]:
+        """
+        Build the 2411 message for a parameter that carries a single value.
 
-        # The prefix is typically "0000{ParamID}000F000000{speed_hex}" 
-        # based on the observed logs.
-        prefix = f"0000{param_id:02X}000F000000{speed_hex}"
+        The valid range and value encoding come from `_PARAM_ENCODINGS`, the
+        complete message template from the per-instance `_param_templates`.
 
-        # Get the suffix from the dictionary for this parameter.
-        suffix = param_suffix[param]
+        :param param: The parameter number.
+        :param value: The value to encode.
+        :return: A tuple with the command string.
+        :raises ValueError: if value is out of range for the parameter, or is not
+            an integer for a parameter that only takes whole values.
+        """
+        _, low, high, encode, error = _PARAM_ENCODINGS[param]
+        if not low <= value <= high:
+            raise ValueError(error)
+        try:
+            return (self._param_templates[param] % encode(value),)
+        except TypeError:
+            # Whole-valued parameters index the hex tables with the value.
+            raise ValueError(f"Value for parameter {param} must be an integer, got {value!r}.") from None
 
-        # Combine prefix + suffix into a single hex string payload.
-        payload = prefix + suffix
-        msg = (
-            f"W --- {self.remote} {self.wtw} --:------ "
-            f"2411 023 {payload}"
-        )
-        return msg
-    
     def _calculate_percentage_from_m3_per_hour(self, m3_per_hour: int) -> int:
         """
         Calculate the fan speed percentage based on the given flow rate in m³/h.
-        The percentage is calculated as a ratio of the given flow rate to the unit's capacity.
+        The percentage is calculated as a ratio of the given flow rate to the unit's capacity,
+        rounded down to a whole percentage.
 
         :param m3_per_hour: The flow rate in m³/h.
         :return: The fan speed percentage.
         """
-        return int((m3_per_hour / self.capacity_in_m3_per_hour) * 100)
+        if isinstance(m3_per_hour, int) and 0 <= m3_per_hour < len(self._pct_table):
+            return self._pct_table[m3_per_hour]
+        # Multiply before dividing so whole flow rates stay in integer math.
+        return int(m3_per_hour * 100 // self._capacity_in_m3_per_hour)
         
 
-    def set_fan_speed(self, level_name: str, m3_per_hour: int):
+    def set_fan_speed(self, level_name: str, m3_per_hour: int) -> Tuple[str, ...]:
         """
         Set the fan speed level for the given level name
-        to the specified speed percentage.
+        to the specified flow rate.
+
+        The level name is looked up in a table that maps each level to its
+        supply and exhaust parameter, and both get the same speed.
+
+        :param level_name: The fan speed level ("low", "medium" or "high", case-insensitive).
+        :param m3_per_hour: The desired flow rate in m³/h.
+        :return: A tuple with the supply and exhaust command strings.
+        :raises ValueError: if level_name is unknown or the flow rate is out of range.
         """
-        lvl = level_name.lower()
+        # Level names are usually passed in lowercase already, so only fold
+        # the case when the direct lookup misses.
+        params = _LEVEL_PARAMS.get(level_name) or _LEVEL_PARAMS.get(level_name.lower())
+        if params is None:
+            raise ValueError("level_name must be 'low/medium/high.")
+        supply_param, exhaust_param = params
 
         percentage = self._calculate_percentage_from_m3_per_hour(m3_per_hour)
-        self.logger.debug(f"Calculated percentage: {percentage}")
-
-        if lvl == "low":
-            # param 3: Low supply, param 4: Low extraction
-            msg3 = self._fan_speed_payload(3, percentage)
-            msg4 = self._fan_speed_payload(4, percentage)
-            return [msg3, msg4]
-
-        elif lvl == "medium":
-            # param 5: Medium supply, param 6: Medium extraction
-            msg5 = self._fan_speed_payload(5, percentage)
-            msg6 = self._fan_speed_payload(6, percentage)
-            return [msg5, msg6]
-
-        elif  lvl == "high":
-            # param 7: High supply, param 8: High extraction
-            msg7 = self._fan_speed_payload(7, percentage)
-            msg8 = self._fan_speed_payload(8, percentage)
-            return [msg7, msg8]
-
-        else:
-            raise ValueError("level_name must be 'low/medium/high.")
+        logger.debug("Calculated percentage: %s", percentage)
+
+        return (
+            self._fan_speed_payload(supply_param, percentage),
+            self._fan_speed_payload(exhaust_param, percentage),
+        )
+
+    def set_fan_speeds(self, levels_and_flows: Iterable[Tuple[str, int]]) -> Tuple[str, ...]:
+        """
+        Set the fan speed for several levels at once.
+
+        The commands for each (level_name, m3_per_hour) pair are generated as in
+        `set_fan_speed` and returned in order in one flat tuple.
+
+        :param levels_and_flows: Pairs of level name and flow rate in m³/h.
+        :return: A tuple with the supply and exhaust command strings for each pair.
+        :raises ValueError: if any level name is unknown or flow rate is out of range.
+        """
+        set_fan_speed = self.set_fan_speed
+        return tuple(
+            msg
+            for level_name, m3_per_hour in levels_and_flows
+            for msg in set_fan_speed(level_name, m3_per_hour)
+        )
+
+    def static_command(self, name: str) -> Tuple[str, ...]:
+        """
+        Generate one of the commands with a fixed payload.
+
+        The named methods such as `set_to_low_mode()` and `open_bypass()` are
+        shortcuts for this method.
+
+        :param name: One of "off", "low", "medium", "high", "auto", "auto2", "boost",
+            "disable", "open_bypass", "close_bypass" or "automatic_bypass".
+        :return: A tuple with the command string.
+        :raises ValueError: if name is not a known command.
+        """
+        try:
+            return self._static_cmds[name]
+        except KeyError:
+            raise ValueError(f"Unknown command name: {name!r}.") from None
 
-    def turn_fan_off(self) -> str:
+    def turn_fan_off(self) -> Tuple[str, ...]:
         """
         Generate the command to turn the ventilation unit off.
 
         :return: The command string to turn off the unit.
         """
-        self.logger.info("Turning the unit off.")
-        payload = "000007"
-        msg = (
-            f"I --- {self.remote} {self.wtw} --:------ "
-            f"22F1 003 {payload}"
-        )
-        return [msg]
+        logger.info("Turning the unit off.")
+        return self.static_command("off")
 
-    def set_to_low_mode(self) -> str:
+    def set_to_low_mode(self) -> Tuple[str, ...]:
         """
         Generate the command to set the unit to low mode.
 
         :return: The command string for low mode.
         """
-        self.logger.info("Setting the unit to low mode.")
-        payload = "000104"
-        msg = (
-            f"I --- {self.remote} {self.wtw} --:------ "
-            f"22F1 003 {payload}"
-        )
-        return [msg]
+        logger.info("Setting the unit to low mode.")
+        return self.static_command("low")
 
-    def set_to_medium_mode(self) -> str:
+    def set_to_medium_mode(self) -> Tuple[str, ...]:
         """
         Generate the command to set the unit to medium mode.
 
         :return: The command string for medium mode.
         """
-        self.logger.info("Setting the unit to medium mode.")
-        payload = "000204"
-        msg = (
-            f"I --- {self.remote} {self.wtw} --:------ "
-            f"22F1 003 {payload}"
-        )
-        return [msg]
+        logger.info("Setting the unit to medium mode.")
+        return self.static_command("medium")
 
-    def set_to_high_mode(self) -> str:
+    def set_to_high_mode(self) -> Tuple[str, ...]:
         """
         Generate the command to set the unit to high mode.
 
         :return: The command string for high mode.
         """
-        self.logger.info("Setting the unit to high mode.")
-        payload = "000304"
-        msg = (
-            f"I --- {self.remote} {self.wtw} --:------ "
-            f"22F1 003 {payload}"
-        )
-        return [msg]
+        logger.info("Setting the unit to high mode.")
+        return self.static_command("high")
 
-    def set_to_auto_mode(self) -> str:
+    def set_to_auto_mode(self) -> Tuple[str, ...]:
         """
         Generate the command to set the unit to auto mode.
 
         :return: The command string for auto mode.
         """
-        self.logger.info("Setting the unit to auto mode.")  
-        payload = "000407"
-        msg = (
-            f"I --- {self.remote} {self.wtw} --:------ "
-            f"22F1 003 {payload}"
-        )
-        return [msg]
+        logger.info("Setting the unit to auto mode.")  
+        return self.static_command("auto")
 
-    def set_to_auto2_mode(self) -> str:
+    def set_to_auto2_mode(self) -> Tuple[str, ...]:
         """
         Generate the command to set the unit to auto2 mode.
 
         :return: The command string for auto2 mode.
         """
-        self.logger.info("Setting the unit to auto2 mode.")
-        payload = "000507"
-        msg = (
-            f"I --- {self.remote} {self.wtw} --:------ "
-            f"22F1 003 {payload}"
-        )
-        return [msg]
+        logger.info("Setting the unit to auto2 mode.")
+        return self.static_command("auto2")
 
-    def set_to_boost_mode(self) -> str:
+    def set_to_boost_mode(self) -> Tuple[str, ...]:
         """
         Generate the command to set the unit to boost mode.
 
         :return: The command string for boost mode.
         """
-        self.logger.info("Setting the unit to boost mode.")
-        payload = "000607"
-        msg = (
-            f"I --- {self.remote} {self.wtw} --:------ "
-            f"22F1 003 {payload}"
-        )
-        return [msg]
+        logger.info("Setting the unit to boost mode.")
+        return self.static_command("boost")
 
-    def disable_mode(self) -> str:
+    def disable_mode(self) -> Tuple[str, ...]:
         """
         Generate the command to disable the unit.
 
         :return: The command string to disable the unit.
         """
-        self.logger.info("Disabling the unit.")
-        payload = "000707"
-        msg = (
-            f"I --- {self.remote} {self.wtw} --:------ "
-            f"22F1 003 {payload}"
-        )
-        return [msg]
+        logger.info("Disabling the unit.")
+        return self.static_command("disable")
 
-    def open_bypass(self) -> str:
+    def open_bypass(self) -> Tuple[str, ...]:
         """
         Generate the command to open the bypass.
 
         :return: The command string to open the bypass.
         """
-        self.logger.info("Open bypass")
-        payload = "00C8EF"
-        msg = (
-            f"W --- {self.remote} {self.wtw} --:------ "
-            f"22F7 003 {payload}"
-        )
-        return [msg]
+        logger.info("Open bypass")
+        return self.static_command("open_bypass")
 
-    def close_bypass(self) -> str:
+    def close_bypass(self) -> Tuple[str, ...]:
         """
         Generate the command to close the bypass.
 
         :return: The command string to close the bypass.
         """
-        self.logger.info("Close bypass")
-        payload = "0000EF"
-        msg = (
-            f"W --- {self.remote} {self.wtw} --:------ "
-            f"22F7 003 {payload}"
-        )
-        return [msg]
+        logger.info("Close bypass")
+        return self.static_command("close_bypass")
 
-    def automatic_bypass(self) -> str:
+    def automatic_bypass(self) -> Tuple[str, ...]:
         """
         Generate the command to set the bypass to auto mode.
 
         :return: The command string to set bypass to auto.
         """
-        self.logger.info("Automatic bypass mode")
-        payload = "00FFEF"
-        msg = (
-            f"W --- {self.remote} {self.wtw} --:------ "
-            f"22F7 003 {payload}"
-        )
-        return [msg]
+        logger.info("Automatic bypass mode")
+        return self.static_command("automatic_bypass")
    ##### 
-    def set_absence_supply_fan_speed(self, speed_percentage: int) -> str:
+    def set_absence_supply_fan_speed(self, speed_percentage: int) -> Tuple[str, ...]:
         """
         Generate the command payload to set the absence supply fan speed (Parameter 1).
 
@@ -318,30 +527,9 @@ class OrconRamsesRFCommand:
         :return: The command string to set the absence supply fan speed.
         :raises ValueError: if speed_percentage is out of range.
         """
-        if not (0 <= speed_percentage <= 40):
-            raise ValueError("Speed percentage for absence supply fan must be between 0 and 40.")
-
-        # Calculate the ParamID for Parameter 1 (fixed as 0x3D).
-        param_id = 0x3D
+        return self._encode_param(1, speed_percentage)
 
-        # Multiply the speed percentage by 2 to get the hex representation.
-        speed_hex = f"{speed_percentage * 2:02X}"
-
-        # Build the prefix based on observations.
-        prefix = f"0000{param_id:02X}000F000000{speed_hex}"
-
-        # Fixed suffix for Parameter 1 based on patterns in data.
-        suffix = "0000000000000050000000010032"
-
-        # Combine prefix + suffix into a single hex string payload.
-        payload = prefix + suffix
-        msg = (
-            f"W --- {self.remote} {self.wtw} --:------ "
-            f"2411 023 {payload}"
-        )
-        return [msg]
-
-    def set_absence_exhaust_fan_speed(self, speed_percentage: int) -> str:
+    def set_absence_exhaust_fan_speed(self, speed_percentage: int) -> Tuple[str, ...]:
         """
         Generate the command payload to set the absence exhaust fan speed (Parameter 2).
 
@@ -355,30 +543,9 @@ class OrconRamsesRFCommand:
         :return: The command string to set the absence exhaust fan speed.
         :raises ValueError: if speed_percentage is out of range.
         """
-        if not (0 <= speed_percentage <= 40):
-            raise ValueError("Speed percentage for absence exhaust fan must be between 0 and 40.")
-
-        # Calculate the ParamID for Parameter 2 (fixed as 0x3E).
-        param_id = 0x3E
-
-        # Multiply the speed percentage by 2 to get the hex representation.
-        speed_hex = f"{speed_percentage * 2:02X}"
-
-        # Build the prefix based on observations.
-        prefix = f"0000{param_id:02X}000F000000{speed_hex}"
+        return self._encode_param(2, speed_percentage)
 
-        # Fixed suffix for Parameter 2 based on patterns in data.
-        suffix = "0000000000000050000000010032"
-
-        # Combine prefix + suffix into a single hex string payload.
-        payload = prefix + suffix
-        msg = (
-            f"W --- {self.remote} {self.wtw} --:------ "
-            f"2411 023 {payload}"
-        )
-        return [msg]
-
-    def set_boost_mode_speed(self, speed_percentage: int) -> str:
+    def set_boost_mode_speed(self, speed_percentage: int) -> Tuple[str, ...]:
         """
         Generate the command payload to set the boost mode fan speed (Parameter 9).
 
@@ -389,30 +556,9 @@ class OrconRamsesRFCommand:
         :return: The command string to set the boost mode fan speed.
         :raises ValueError: if speed_percentage is out of range.
         """
-        if not (0 <= speed_percentage <= 100):
-            raise ValueError("Speed percentage for boost mode must be between 0 and 100.")
-
-        # Calculate the ParamID for Parameter 9 (fixed as 0x95).
-        param_id = 0x95
-
-        # Multiply the speed percentage by 2 to get the hex representation.
-        speed_hex = f"{speed_percentage * 2:02X}"
-
-        # Build the prefix based on observations.
-        prefix = f"0000{param_id:02X}000F000000{speed_hex}"
-
-        # Fixed suffix for Parameter 9 based on patterns in data.
-        suffix = "00000000000000C8000000010032"
-
-        # Combine prefix + suffix into a single hex string payload.
-        payload = prefix + suffix
-        msg = (
-            f"W --- {self.remote} {self.wtw} --:------ "
-            f"2411 023 {payload}"
-        )
-        return [msg]
+        return self._encode_param(9, speed_percentage)
 
-    def set_filter_replacement_time(self, days: int) -> str:
+    def set_filter_replacement_time(self, days: int) -> Tuple[str, ...]:
         """
         Generate the command payload to set the time until filter replacement (Parameter 10).
 
@@ -431,28 +577,12 @@ class OrconRamsesRFCommand:
         :return: The command string to set the filter replacement time.
         :raises ValueError: if days are not in the predefined set of values.
         """
-        # Mapping of allowed days to their corresponding payload values.
-        payload_map = {
-            90:  "00003100100000005A00000000000007080000001E002C",
-            120: "00003100100000007800000000000007080000001E002C",
-            150: "00003100100000009600000000000007080000001E002C",
-            180: "0000310010000000B400000000000007080000001E002C",
-        }
-
-        if days not in payload_map:
-            raise ValueError("Days must be one of the following: 90, 120, 150, 180.")
-
-        # Retrieve the corresponding payload for the given days.
-        payload = payload_map[days]
-        
-        # Build the complete message.
-        msg = (
-            f"W --- {self.remote} {self.wtw} --:------ "
-            f"2411 023 {payload}"
-        )
-        return [msg]
+        try:
+            return self._filter_msgs[days]
+        except KeyError:
+            raise ValueError("Days must be one of the following: 90, 120, 150, 180.") from None
 
-    def set_sensor_sensitivity(self, sensitivity: int) -> str:
+    def set_sensor_sensitivity(self, sensitivity: int) -> Tuple[str, ...]:
         """
         Generate the command payload to set the sensor sensitivity (Parameter 12).
 
@@ -467,30 +597,9 @@ class OrconRamsesRFCommand:
         :return: The command string to set the sensor sensitivity.
         :raises ValueError: if sensitivity is out of range.
         """
-        if not (0 <= sensitivity <= 15):
-            raise ValueError("Sensor sensitivity must be between 0 and 15.")
-
-        # Calculate the ParamID for Parameter 12 (fixed as 0x52).
-        param_id = 0x52
-
-        # Multiply the sensitivity value by 12 to match observed encoding (e.g., 5 -> 0x3C).
-        sensitivity_hex = f"{sensitivity * 12:02X}"
+        return self._encode_param(12, sensitivity)
 
-        # Build the prefix based on observations.
-        prefix = f"0000{param_id:02X}0001000000{sensitivity_hex}"
-
-        # Fixed suffix for Parameter 12 based on patterns in data.
-        suffix = "00000000000000FA000000010032"
-
-        # Combine prefix + suffix into a single hex string payload.
-        payload = prefix + suffix
-        msg = (
-            f"W --- {self.remote} {self.wtw} --:------ "
-            f"2411 023 {payload}"
-        )
-        return [msg]
-
-    def set_humidity_scenario(self, mode: int) -> str:
+    def set_humidity_scenario(self, mode: int) -> Tuple[str, ...]:
         """
         Generate the command payload to set the humidity scenario (Parameter 11).
 
@@ -506,19 +615,13 @@ class OrconRamsesRFCommand:
         :return: The command string to set the humidity scenario.
         :raises ValueError: if mode is not 0 or 1.
         """
-        if mode not in (0, 1):
-            raise ValueError("Humidity scenario mode must be 0 (Midden) or 1 (Hoog).")
+        try:
+            return self._humidity_msgs[mode]
+        except KeyError:
+            raise ValueError("Humidity scenario mode must be 0 (Midden) or 1 (Hoog).") from None
 
-        if mode == 0:
-            msg = f"W --- {self.remote} {self.wtw} --:------ 2411 023 00004E0000000000000000000000000001000000010000"
-        
-        if mode == 1:
-            msg = f"W --- {self.remote} {self.wtw} --:------ 2411 023 00004E0000000000010000000000000001000000010000"
-
-        return [msg]
 
-
-    def set_humidity_scenario_runtime(self, minutes: int) -> str:
+    def set_humidity_scenario_runtime(self, minutes: int) -> Tuple[str, ...]:
         """
         Generate the command payload to set the runtime for the humidity scenario (Parameter 13).
 
@@ -533,30 +636,9 @@ class OrconRamsesRFCommand:
         - Value 16: W --- 37:XXXXX 32:YYYYY --:------ 2411 023 0000540000000000100000000F0000003C00000001002A
         - Value 20: W --- 37:XXXXX 32:YYYYY --:------ 2411 023 0000540000000000140000000F0000003C00000001002A
         """
-        if not (15 <= minutes <= 60):
-            raise ValueError("Humidity scenario runtime must be between 15 and 60 minutes.")
-
-        # Calculate the ParamID for Parameter 13 (fixed as 0x54).
-        param_id = 0x54
+        return self._encode_param(13, minutes)
 
-        # Convert the number of minutes to its hexadecimal representation.
-        minutes_hex = f"{minutes:02X}"
-
-        # Build the prefix based on observations.
-        prefix = f"0000{param_id:02X}0000000000{minutes_hex}"
-
-        # Fixed suffix for Parameter 13 based on patterns in data.
-        suffix = "0000000F0000003C00000001002A"
-
-        # Combine prefix + suffix into a single hex string payload.
-        payload = prefix + suffix
-        msg = (
-            f"W --- {self.remote} {self.wtw} --:------ "
-            f"2411 023 {payload}"
-        )
-        return [msg]
-
-    def set_comfort_temperature(self, temperature: float) -> str:
+    def set_comfort_temperature(self, temperature: float) -> Tuple[str, ...]:
         """
         Generate the command payload to set the comfort temperature (Parameter 14).
 
@@ -576,23 +658,9 @@ class OrconRamsesRFCommand:
         :return: The command string to set the comfort temperature.
         :raises ValueError: if temperature is out of range.
         """
-        if not (0.0 <= temperature <= 30.0):
-            raise ValueError("Comfort temperature must be between 0.0 and 30.0°C.")
-
-        # Convert the temperature to the hexadecimal value used in the payload
-        temperature_hex = int(temperature * 100)
-
-        # Format the temperature as a 4-character uppercase hex string
-        temperature_encoded = f"{temperature_hex:04X}"
-
-        msg = (
-            f"W --- {self.remote} {self.wtw} --:------ "
-            f"2411 023 00007500920000{temperature_encoded}0000000000000BB8000000010001"
-        )
-
-        return [msg]
+        return self._encode_param(14, temperature)
 
-    def set_cooling_activation_temp(self, temperature_celsius: int) -> str:
+    def set_cooling_activation_temp(self, temperature_celsius: int) -> Tuple[str, ...]:
         """
         Set the outdoor temperature for activation of the cooling season in the Orcon WTW unit.
 
@@ -615,31 +683,9 @@ class OrconRamsesRFCommand:
         Returns:
             str: The command string to send to the WTW unit.
         """
-        if not (0 <= temperature_celsius <= 30):
-            raise ValueError("Activation temperature must be between 0 and 30 degrees Celsius.")
-
-        # Calculate the ParamID for Parameter 15
-        param_id = 0xA1
-
-        # Multiply the temperature by 2 to get the hex representation.
-        temperature_hex = f"{temperature_celsius * 2:02X}"
-
-        # Build the prefix based on observations.
-        prefix = f"0000{param_id:02X}000F000000{temperature_hex}"
-
-        # Fixed suffix for Parameter 15 based on patterns in data.
-        suffix = "000000000000003C000000010001"
-
-        # Combine prefix + suffix into a single hex string payload.
-        payload = prefix + suffix
-        msg = (
-            f"W --- {self.remote} {self.wtw} --:------ "
-            f"2411 023 {payload}"
-        )
+        return self._encode_param(15, temperature_celsius)
 
-        return [msg]
-
-    def set_min_fan_speed_during_bypass(self, speed_percentage: int) -> str:
+    def set_min_fan_speed_during_bypass(self, speed_percentage: int) -> Tuple[str, ...]:
         """
         Build the hex payload for setting the minimum fan speed during bypass.
         This is for parameter 16, based on observed radio traffic.
@@ -665,24 +711,15 @@ class OrconRamsesRFCommand:
         :return: The hex string payload (without spacing).
         :raises ValueError: if speed_percentage is out of range.
         """
-        if not (0 <= speed_percentage <= 100):
-            raise ValueError("Speed percentage for minimum fan speed during bypass must be between 0 and 100.")
-
-        # Calculate the hex value for the speed percentage
-        hex_speed = f"{speed_percentage * 10:04X}"  # Convert to a 4-character zero-padded hex string
-
-        # Build the payload string
-        payload = f"00007900110000{hex_speed}00000000000003E8000000010032"
-
-        # Build the complete message
-        msg = (
-            f"W --- {self.remote} {self.wtw} --:------ "
-            f"2411 023 {payload}"
-        )
-
-        return [msg]
+        msgs, low, high, error = self._min_bypass_msgs
+        if not low <= speed_percentage <= high:
+            raise ValueError(error)
+        try:
+            return msgs[speed_percentage - low]
+        except TypeError:
+            raise ValueError(f"Value for parameter 16 must be an integer, got {speed_percentage!r}.") from None
 
-    def set_bypass_fan_speed_regulation(self, setting: int) -> str:
+    def set_bypass_fan_speed_regulation(self, setting: int) -> Tuple[str, ...]:
         """
         Adjust the regulation setting for bypass fan speed.
 
@@ -696,24 +733,12 @@ class OrconRamsesRFCommand:
         :return: The command string for setting the bypass fan speed regulation.
         :raises ValueError: If the provided setting is not 3 or 4.
         """
-        if setting not in (3, 4):
-            raise ValueError("Regulation setting for parameter 17 must be 3 (medium) or 4 (high).")
-
-        if setting == 3:
-            payload = "0000E70000000000030000000300000005000000010000"
-
-        if setting == 4:
-            payload = "0000E70000000000040000000300000005000000010000"
-
-        # Construct the full message
-        msg = (
-            f"W --- {self.remote} {self.wtw} --:------ "
-            f"2411 023 {payload}"
-        )
-
-        return [msg]
+        try:
+            return self._bypass_regulation_msgs[setting]
+        except KeyError:
+            raise ValueError("Regulation setting for parameter 17 must be 3 (medium) or 4 (high).") from None
     
-    def set_bypass_fan_speed_setting(self, setting: int) -> str:
+    def set_bypass_fan_speed_setting(self, setting: int) -> Tuple[str, ...]:
         """
         Adjust the bypass fan speed setting.
 
@@ -728,19 +753,7 @@ class OrconRamsesRFCommand:
         :return: The command string for setting the bypass fan speed.
         :raises ValueError: If the provided setting is not 0 or 1.
         """
-        if setting not in (0, 1):
-            raise ValueError("Bypass fan speed setting for parameter 18 must be 0 or 1.")
-        
-        if setting == 0:
-            payload = "0000E80000000000000000000000000001000000010000"
-
-        if setting == 1:
-            payload = "0000E80000000000010000000000000001000000010000"
-        
-        # Construct the full message
-        msg = (
-            f"W --- {self.remote} {self.wtw} --:------ "
-            f"2411 023 {payload}"
-        )
-
-        return [msg]
+        try:
+            return self._bypass_setting_msgs[setting]
+        except KeyError:
+            raise ValueError("Bypass fan speed setting for parameter 18 must be 0 or 1.") from None